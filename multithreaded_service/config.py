@@ -1,34 +1,43 @@
 # Minimal runtime config via env vars; no heavy deps
 import os
 
+# Truthy spellings accepted by env_bool; built once at import.
+_TRUE = frozenset(("1", "true", "yes", "on"))
+
 # Purpose: read a boolean environment variable.
 # How: returns default if unset; treats "1","true","yes","on" (case-insensitive) as True.
 # Use: call env_bool("MY_FLAG", default=False) to gate features.
 def env_bool(key: str, default: bool = False) -> bool:
-    try:
-        val = os.getenv(key)
-        if val is None:
-            return default
-        return val.lower() in {"1", "true", "yes", "on"}
-    except Exception:
-        return default
+    val = os.environ.get(key)
+    return default if val is None else val.lower() in _TRUE
     
 # Purpose: read a float environment variable.
 # How: converts the env value to float, returns default on unset or parse error.
 # Use: call env_float("TIMEOUT_S", 1.0) to configure timeouts.
 def env_float(key: str, default: float) -> float:
+    val = os.environ.get(key)
+    if val is None:
+        return default
     try:
-        val = os.getenv(key)
-        return float(val) if val is not None else default
-    except Exception:
+        return float(val)
+    except ValueError:
         return default
     
 # Purpose: read an int environment variable.
-# How: converts the env value to int, returns default on unset or parse error.
+# How: pre-validates an optional sign plus decimal digits, so bad input never raises; else returns default.
 # Use: call env_int("MAX_WORKERS", 4) to configure concurrency.
 def env_int(key: str, default: int) -> int:
-    try:
-        val = os.getenv(key)
-        return int(val) if val is not None else default
-    except Exception:
-        return default
\ No newline at end of file
+    val = os.environ.get(key)
+    if val is None:
+        return default
+    s = val.strip()
+    digits = s[1:] if s[:1] in ("-", "+") else s
+    return int(s) if digits.isdecimal() else default
+
+# Purpose: number of CPUs this process may actually run on.
+# How: os.sched_getaffinity(0) honors cgroup/cpuset pinning on Linux; falls back to os.cpu_count() or 2 elsewhere.
+# Use: size process/thread pools so CI runners and containers aren't over-subscribed.
+def usable_cpu_count() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 2
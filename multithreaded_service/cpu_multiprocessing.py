@@ -0,0 +1,81 @@
+# Process-based CPU parallelism: sidestep the GIL with a ProcessPoolExecutor
+from typing import Iterable, List, Optional, Tuple
+import atexit
+import multiprocessing
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from .config import usable_cpu_count
+from .cpu_tasks import fib_naive
+from .logging_config import get_logger
+from .timing import timer
+
+_logger = get_logger("cpu_mp")
+
+# Shared pool reused across calls so each measurement doesn't pay process spawn/import cost.
+# Fixed size for the life of the process; it is never rebuilt, so callers can't race a shutdown.
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+
+# Purpose: choose the multiprocessing start method for the shared pool.
+# How: fork on Linux only while this process is single-threaded; otherwise forkserver (Linux) or the platform default.
+# Use: called once from _get_pool; the pool is built lazily, so other threads (e.g. the sleep pool) may already be running.
+def _mp_context() -> Optional[multiprocessing.context.BaseContext]:
+    if not sys.platform.startswith("linux"):
+        return None
+    # Forking with live threads can copy a lock held by another thread and deadlock
+    # the child (Python 3.12+ warns about it); forkserver forks from a clean process.
+    if threading.active_count() > 1:
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("fork")
+
+# Purpose: return a lazily-created, process-wide ProcessPoolExecutor.
+# How: builds the pool once on first use, sized to usable_cpu_count() (see _mp_context for the start method), and registers shutdown at exit once.
+# Use: call _get_pool() instead of `with ProcessPoolExecutor(...)`; limit concurrency per call with _chunksize.
+def _get_pool() -> ProcessPoolExecutor:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ProcessPoolExecutor(max_workers=usable_cpu_count(), mp_context=_mp_context())
+            atexit.register(_POOL.shutdown)
+        return _POOL
+
+# Purpose: pick a pool.map chunksize that batches IPC and caps a call's concurrency.
+# How: at full pool width use ~4 chunks per worker for load balancing; for fewer workers split into exactly `workers` chunks, so at most that many run at once.
+# Use: pool.map(fn, items, chunksize=_chunksize(len(items), workers)).
+def _chunksize(n_items: int, workers: int) -> int:
+    if workers >= usable_cpu_count():
+        return max(1, n_items // (4 * workers))
+    return max(1, -(-n_items // workers))
+
+# Purpose: CPU-heavy unit of work executed inside worker processes.
+# How: top-level function (picklable under spawn) running the naive recursive fib.
+# Use: pass to pool.map; keep n small (20-30) so each task is measurable but short.
+def fib_task(n: int) -> int:
+    """Worker entrypoint; naive fib keeps the task CPU bound."""
+    return fib_naive(n)
+
+# Purpose: compute fib_task for many inputs across processes, in input order.
+# How: pool.map on the shared pool; chunksize batches pickling/IPC instead of one round-trip per task and keeps at most `workers` chunks in flight.
+# Use: returns list of (n, fib(n)); ordering matches the input iterable.
+def run_process_pool(nums: Iterable[int], workers: Optional[int] = None) -> List[Tuple[int, int]]:
+    """Fan out fib_task over processes; returns [(n, result)] in input order."""
+    nums = list(nums)
+    workers = workers or usable_cpu_count()
+    chunksize = _chunksize(len(nums), workers)
+    return list(zip(nums, _get_pool().map(fib_task, nums, chunksize=chunksize)))
+
+# Purpose: compare serial vs process pool wall-clock for the same CPU-bound work.
+# How: time a plain loop and run_process_pool with the timer context manager.
+# Use: python -m multithreaded_service.cpu_multiprocessing
+def main(n: int = 27, tasks: int = 4) -> None:
+    nums = [n] * tasks
+    with timer("serial_cpu"):
+        serial = [(x, fib_task(x)) for x in nums]
+    with timer("process_cpu"):
+        parallel = run_process_pool(nums)
+    if serial != parallel:
+        _logger.error("cpu_mp_mismatch serial and process results differ")
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,102 @@
 # CPU bound helpers; input validation and safe fallbacks
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 from .logging_config import get_logger
 
+# Optional JIT: numba compiles to native code that can run without the GIL.
+# Fall back to a pass-through decorator so the pure Python bodies still work.
+try:
+    from numba import njit as _njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def _njit(*args, **kwargs):
+        def _wrap(fn):
+            return fn
+        return _wrap
+
+# Optional GMP bigints: gmpy2.mpz multiplies huge ints far faster than CPython's Karatsuba.
+try:
+    from gmpy2 import mpz as _MPZ
+except ImportError:
+    _MPZ = int
+
 _logger = get_logger("cpu")
 
+# Purpose: cutoff where fast doubling beats the simple loop.
+# How: below this n the loop's few additions are cheaper than the doubling recursion.
+# Use: fib dispatches to fib_fast_doubling at or above this value.
+_FAST_DOUBLING_MIN_N = 90
+
+# Purpose: compute Fibonacci numbers in O(log n) big-int multiplies.
+# How: fast doubling via F(2k)=F(k)(2F(k+1)-F(k)) and F(2k+1)=F(k)^2+F(k+1)^2.
+# Use: call fib_fast_doubling(n) for very large n (10^5 and up); uses gmpy2 bigints when installed.
+def fib_fast_doubling(n: int) -> int:
+    """Fast doubling Fib; O(log n) steps, practical for very large n."""
+    if n < 0:
+        raise ValueError("n must be >= 0")
+    def _fd(k: int) -> Tuple[int, int]:
+        if k == 0:
+            return _MPZ(0), _MPZ(1)
+        a, b = _fd(k >> 1)
+        c = a * ((b << 1) - a)
+        d = a * a + b * b
+        return (c, d) if k & 1 == 0 else (d, c + d)
+    return int(_fd(n)[0])
+
+# Purpose: small-n Fibonacci via a cached iterative loop.
+# How: two-variable loop; lru_cache covers every n below _FAST_DOUBLING_MIN_N, and those values fit in a machine word or two.
+# Use: internal fast path for fib; large n is never cached so huge bigints aren't pinned in memory.
+@lru_cache(maxsize=_FAST_DOUBLING_MIN_N)
+def _fib_small(n: int) -> int:
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+# Purpose: compute Fibonacci numbers, picking the cheapest algorithm for n.
+# How: cached iterative loop for small n; uncached fast doubling from _FAST_DOUBLING_MIN_N up.
+# Use: default fib for pipeline stages and tests; see fib_naive for the CPU-heavy demo.
+def fib(n: int) -> int:
+    """Iterative Fib for small n, fast doubling for large n."""
+    if n < 0:
+        raise ValueError("n must be >= 0")
+    if n >= _FAST_DOUBLING_MIN_N:
+        return fib_fast_doubling(n)
+    return _fib_small(n)
+
 # Purpose: compute Fibonacci numbers (naive recursive impl).
 # How: recursion; intentionally CPU-heavy to demonstrate GIL and CPU-bound work.
-# Use: call fib(n) for small n in tests or to show CPU contention in demos.
-def fib(n: int) -> int:
+# Use: call fib_naive(n) for small n to show CPU contention in demos.
+def fib_naive(n: int) -> int:
     """Naive Fib; intentionally CPU heavy to surface GIL tradeoffs."""
     if n < 0:
         raise ValueError("n must be >= 0")
-    if n <=1:
+    if n <= 1:
         return n
-    return fib(n - 1) + fib(n - 2)
+    return fib_naive(n - 1) + fib_naive(n - 2)
+
+# Purpose: memoized recursive Fibonacci for callers that want the recursive shape.
+# How: lru_cache stores every computed value so each n is evaluated once.
+# Use: call fib_recursive_memo(n) for moderate n; recursion depth still grows with n.
+@lru_cache(maxsize=None)
+def fib_recursive_memo(n: int) -> int:
+    """Memoized recursive Fib; O(n) first call, O(1) repeats."""
+    if n < 0:
+        raise ValueError("n must be >= 0")
+    if n <= 1:
+        return n
+    return fib_recursive_memo(n - 1) + fib_recursive_memo(n - 2)
 
 # Purpose: compute sum of integers from 0 to n-1.
-# How: uses Python's built-in sum over range; efficient in Python for moderate n.
-# Use: useful to compare CPU-bound loops vs recursive workloads.
+# How: Gauss closed form n*(n-1)//2; O(1) and exact for any int.
+# Use: cheap reference value; see sum_range_njit for a CPU-bound loop workload.
 def sum_range(n: int) -> int:
-    """CPU bound sum with basic validation."""
+    """Closed-form sum with basic validation."""
     if n < 0:
         raise ValueError("n must be >= 0")
-    return sum(range(n))
+    return n * (n - 1) // 2
 
 # Purpose: safe wrapper around fib that avoids raising in production paths.
 # How: catches exceptions from fib, logs error, and returns a default if provided.
@@ -32,7 +106,45 @@ def safe_fib(n: int, default: Optional[int] = None) -> int:
     try:
         return fib(n)
     except Exception as e:
-        _logger.error(f"safe_fib_error n={n} err={type(e).__name__}")
+        _logger.error("safe_fib_error n=%s err=%s", n, e.__class__.__name__)
         if default is None:
             raise
-        return default
\ No newline at end of file
+        return default
+
+# Purpose: native-code Fibonacci that releases the GIL while it runs.
+# How: numba @njit(nogil=True) compiles the int64 loop; cache=True amortizes JIT across runs.
+# Use: call from threads to get real CPU parallelism; int64 overflows past n=92, so keep n small.
+@_njit(cache=True, nogil=True)
+def fib_njit(n: int) -> int:
+    """JIT-compiled iterative Fib; GIL-free when numba is installed."""
+    if n < 0:
+        raise ValueError("n must be >= 0")
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+# Purpose: native-code naive recursive Fibonacci that releases the GIL.
+# How: same exponential recursion as fib_naive, compiled by numba @njit(nogil=True).
+# Use: like-for-like CPU load against fib_naive when comparing threads with and without the GIL.
+@_njit(cache=True, nogil=True)
+def fib_naive_njit(n: int) -> int:
+    """JIT-compiled naive Fib; same work as fib_naive, GIL-free when numba is installed."""
+    if n < 0:
+        raise ValueError("n must be >= 0")
+    if n <= 1:
+        return n
+    return fib_naive_njit(n - 1) + fib_naive_njit(n - 2)
+
+# Purpose: native-code sum of integers from 0 to n-1 that releases the GIL.
+# How: numba @njit(nogil=True) compiles an explicit int64 loop.
+# Use: CPU-bound thread workload that scales across cores without a process pool.
+@_njit(cache=True, nogil=True)
+def sum_range_njit(n: int) -> int:
+    """JIT-compiled loop sum; GIL-free when numba is installed."""
+    if n < 0:
+        raise ValueError("n must be >= 0")
+    total = 0
+    for i in range(n):
+        total += i
+    return total
@@ -1,7 +1,11 @@
 # IO helpers with robust error handling, retries, and safe generators
 from typing import Iterable, Iterator, List, Optional, Tuple
+import asyncio
+import threading
 import time
 import random
+from collections import OrderedDict
+import aiohttp
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util import Retry
@@ -10,45 +14,77 @@ from . import DEFAULT_TIMEOUT_S, DEFAULT_USER_AGENT, DEFAULT_RETRIES
 
 _logger = get_logger("io")
 
+# Dedicated RNG for simulated IO jitter; reusable and seedable without touching global random state.
+_JITTER_RNG = random.Random()
+_JITTER_S = 0.02
+
+# Shared retry policy built once at import. Each session still gets its own HTTPAdapter:
+# Session.close() closes its adapters, so a shared adapter would let one closed session
+# tear down the connection pool of every cached one.
+_RETRY = Retry(
+    status_forcelist=[429, 500, 502, 503, 504],
+    total=DEFAULT_RETRIES,
+    backoff_factor=0.2,
+    allowed_methods=frozenset(["GET", "HEAD"])
+)
+
+# Purpose: requests.Session that applies a default timeout to every request.
+# How: overrides request() and sets timeout if the caller didn't pass one; defined once at import.
+# Use: constructed by _session; avoids monkeypatching Session.request.
+class _TimeoutSession(requests.Session):
+    def __init__(self, timeout_val: float, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._default_timeout = timeout_val
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self._default_timeout)
+        return super().request(method, url, **kwargs)
+
 # Purpose: create a requests.Session preconfigured with retries and a default timeout.
-# How: subclass requests.Session to override request() and set timeout if absent.
+# How: builds a _TimeoutSession and mounts its own HTTPAdapter, reusing the prebuilt Retry policy, for http and https.
 # Use: call _session(timeout, retries) to get a configured Session usable with `with`.
 def _session(timeout: float = DEFAULT_TIMEOUT_S, retries: int = DEFAULT_RETRIES) -> requests.Session:
-    # use a tiny Session subclass to set a default timeout without monkeypatching.
-    class _TimeoutSession(requests.Session):
-        def __init__(self, timeout_val: float, *args, **kwargs):
-            super().__init__(*args, **kwargs)
-            self._default_timeout = timeout_val
-
-        def request(self, method: str, url: str, **kwargs) -> requests.Response:
-            kwargs.setdefault("timeout", self._default_timeout)
-            return super().request(method, url, **kwargs)
-
     sess = _TimeoutSession(timeout)
-    adapter = HTTPAdapter(
-        max_retries=Retry(
-            status_forcelist=[429, 500, 502, 503, 504],
-            total=retries,
-            backoff_factor=0.2,
-            allowed_methods=frozenset(["GET", "HEAD"])
-        )
-    )
+    retry = _RETRY if retries == DEFAULT_RETRIES else _RETRY.new(total=retries)
+    adapter = HTTPAdapter(max_retries=retry)
     sess.headers.update({"User-Agent": DEFAULT_USER_AGENT})
     sess.mount("http://", adapter)
     sess.mount("https://", adapter)
     return sess
 
+# Cached sessions keyed by (timeout, retries), oldest first; evicted sessions are closed.
+_SESSIONS: "OrderedDict[Tuple[float, int], requests.Session]" = OrderedDict()
+_SESSIONS_LOCK = threading.Lock()
+_MAX_SESSIONS = 8
+
+# Purpose: share one configured Session per (timeout, retries) so connections are reused.
+# How: small LRU dict under a lock; the least recently used session is closed on eviction so its sockets are released.
+# Use: call _get_session(...) in fetch paths; never close the returned session.
+# Note: requests does not document Session as thread-safe (cookie jar and adapter state are shared).
+# We accept that for plain cookie-less GETs from threads; use a per-thread _session() if that matters.
+def _get_session(timeout: float = DEFAULT_TIMEOUT_S, retries: int = DEFAULT_RETRIES) -> requests.Session:
+    key = (timeout, retries)
+    with _SESSIONS_LOCK:
+        sess = _SESSIONS.get(key)
+        if sess is not None:
+            _SESSIONS.move_to_end(key)
+            return sess
+        sess = _SESSIONS[key] = _session(timeout=timeout, retries=retries)
+        if len(_SESSIONS) > _MAX_SESSIONS:
+            _, evicted = _SESSIONS.popitem(last=False)
+            evicted.close()
+        return sess
+
 # Purpose: fetch a single URL and return (status_code, error).
-# How: opens a configured Session and uses s.get(); catches requests exceptions.
+# How: reuses the cached Session (keep-alive pooling) and uses s.get(); catches requests exceptions.
 # Use: returns (HTTP code, None) on success or (0, error-string) on failure.
 def fetch_url(url: str, timeout: float = DEFAULT_TIMEOUT_S) -> Tuple[int, Optional[str]]:
     """Return (status_code, error). Non-exceptions return error=None"""
     try:
-        with _session(timeout=timeout) as s:
-            resp = s.get(url)
-            return resp.status_code, None
+        resp = _get_session(timeout, DEFAULT_RETRIES).get(url)
+        return resp.status_code, None
     except requests.RequestException as e:
-        _logger.warning(f"fetch_url_failed url={url} err={type(e).__name__}")
+        _logger.warning("fetch_url_failed url=%s err=%s", url, e.__class__.__name__)
         return 0, str(e)
     
 # Purpose: fetch many URLs serially, collecting results.
@@ -62,6 +98,35 @@ def fetch_all_serial(urls: Iterable[str], timeout: float = DEFAULT_TIMEOUT_S) ->
         results.append((u, code, err))
     return results
 
+# Purpose: fetch one URL on a shared aiohttp session, never raising.
+# How: awaits the GET inside the session; maps client/timeout errors to (url, 0, error).
+# Use: building block for fetch_all_async; keeps one failure from cancelling the batch.
+async def _fetch_one_async(s: aiohttp.ClientSession, url: str) -> Tuple[str, int, Optional[str]]:
+    try:
+        async with s.get(url) as resp:
+            return url, resp.status, None
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        _logger.warning("fetch_one_async_failed url=%s err=%s", url, e.__class__.__name__)
+        return url, 0, str(e) or e.__class__.__name__
+
+# Purpose: run all GETs concurrently on one event loop with a pooled connector.
+# How: single ClientSession with TCPConnector(limit) caps open sockets; asyncio.gather preserves input order.
+# Use: internal coroutine behind fetch_all_async.
+async def _fetch_all_async(urls: List[str], timeout: float, limit: int) -> List[Tuple[str, int, Optional[str]]]:
+    async with aiohttp.ClientSession(
+        headers={"User-Agent": DEFAULT_USER_AGENT},
+        timeout=aiohttp.ClientTimeout(total=timeout),
+        connector=aiohttp.TCPConnector(limit=limit),
+    ) as s:
+        return list(await asyncio.gather(*[_fetch_one_async(s, u) for u in urls]))
+
+# Purpose: fetch many URLs concurrently from a single thread.
+# How: asyncio.run drives _fetch_all_async; sockets are multiplexed by the event loop, not threads.
+# Use: returns list of (url, status, error) in input order; call from sync code only (not inside a running loop).
+def fetch_all_async(urls: Iterable[str], timeout: float = DEFAULT_TIMEOUT_S, limit: int = 100) -> List[Tuple[str, int, Optional[str]]]:
+    """Async fan-out; returns list of (url, status, error) like fetch_all_serial."""
+    return asyncio.run(_fetch_all_async(list(urls), timeout, limit))
+
 # Purpose: a memory-friendly generator yielding per-URL results as they complete.
 # How: yields (url, status, error) one at a time and catches unexpected exceptions per-item.
 # Use: iterate over this to process results without holding entire list in memory.
@@ -72,7 +137,7 @@ def iter_urls_serial(urls: Iterable[str], timeout: float = DEFAULT_TIMEOUT_S) ->
             code, err = fetch_url(u, timeout=timeout)
             yield u, code, err
         except Exception as e:
-            _logger.error(f"iter_urls_serial_unexpected url={u} err={type(e).__name__}")
+            _logger.error("iter_urls_serial_unexpected url=%s err=%s", u, e.__class__.__name__)
             yield u, 0, str(e)
             
 # Purpose: simulate IO latency without external network calls.
@@ -83,16 +148,20 @@ def pretend_io(duration: float = 0.1) -> float:
     start = time.perf_counter()
     try:
         # Small jitter simulates real IO variance without external calls
-        time.sleep(max(0.0, duration + random.uniform(-0.02, 0.02)))
+        time.sleep(max(0.0, duration + _JITTER_RNG.uniform(-_JITTER_S, _JITTER_S)))
         return time.perf_counter() - start
     except Exception as e:
-        _logger.error(f"pretend_io_error err={type(e).__name__}")
+        _logger.error("pretend_io_error err=%s", e.__class__.__name__)
         return time.perf_counter() - start
     
 # Purpose: yield multiple pretend_io durations without allocating a list.
-# How: simple generator that calls pretend_io `count` times.
+# How: generator with the sleep loop inlined; RNG and clock bound to locals once, optional seed for determinism.
 # Use: iterate to simulate repeated IO operations for load tests or demos.
-def iter_pretend_io(count: int, duration: float = 0.05) -> Iterator[float]:
+def iter_pretend_io(count: int, duration: float = 0.05, seed: Optional[int] = None) -> Iterator[float]:
     """Yield 'count' pretend IO durations; generator keeps memory small."""
+    uniform = (random.Random(seed) if seed is not None else _JITTER_RNG).uniform
+    perf, sleep = time.perf_counter, time.sleep
     for _ in range(count):
-        yield pretend_io(duration)
\ No newline at end of file
+        start = perf()
+        sleep(max(0.0, duration + uniform(-_JITTER_S, _JITTER_S)))
+        yield perf() - start
\ No newline at end of file
@@ -0,0 +1,64 @@
+# Side-by-side timings: threads vs processes on IO-bound and CPU-bound work
+from concurrent.futures import ThreadPoolExecutor
+from .config import usable_cpu_count
+from .cpu_multiprocessing import _chunksize, _get_pool
+from .cpu_tasks import HAS_NUMBA, fib_naive, fib_naive_njit
+from .io_tasks import pretend_io
+from .logging_config import get_logger
+from .timing import timer
+
+_logger = get_logger("io_vs_cpu")
+
+# Workload size: N tasks per mode, each CPU task computes fib(FIB_N)
+N = 4
+FIB_N = 27
+IO_S = 0.2
+
+# Purpose: CPU-bound unit of work for thread and process pools.
+# How: top-level function so it pickles under spawn; ignores its argument (map index).
+# Use: pool.map(_cpu_worker, range(N)); never pass a lambda to a ProcessPoolExecutor.
+def _cpu_worker(_: int) -> int:
+    return fib_naive(FIB_N)
+
+# Purpose: CPU-bound unit of work that releases the GIL when numba is installed.
+# How: the same naive recursion as _cpu_worker, compiled with @njit(nogil=True); only the GIL differs.
+# Use: compare with _cpu_worker under threads to see GIL-free scaling (only meaningful when HAS_NUMBA).
+def _cpu_worker_nogil(_: int) -> int:
+    return fib_naive_njit(FIB_N)
+
+# Purpose: IO-bound unit of work (simulated) for the thread pool.
+# How: pretend_io sleeps, which releases the GIL.
+# Use: pool.map(_io_worker, range(N)).
+def _io_worker(_: int) -> float:
+    return pretend_io(IO_S)
+
+# Purpose: trivial task used to start the process-pool workers before timing.
+# How: top-level (picklable) and returns immediately, so warm-up pays only spawn/import cost.
+# Use: pool.map(_noop_worker, range(workers)) before the timed process run.
+def _noop_worker(_: int) -> None:
+    return None
+
+# Purpose: print wall-clock time for each concurrency mode over the same workload.
+# How: timer wraps each pool.map; process mode reuses the shared pool and chunks tasks; the nogil mode runs only with numba.
+# Use: python -m multithreaded_service.io_vs_cpu_timing
+def main() -> None:
+    workers = min(N, usable_cpu_count())
+    chunksize = _chunksize(N, workers)
+    with ThreadPoolExecutor(max_workers=N) as pool:
+        with timer("threaded_io"):
+            list(pool.map(_io_worker, range(N)))
+        with timer("threaded_cpu"):
+            list(pool.map(_cpu_worker, range(N)))
+        if HAS_NUMBA:
+            fib_naive_njit(FIB_N)  # warm the JIT so compile time isn't measured
+            with timer("threaded_cpu_nogil"):
+                list(pool.map(_cpu_worker_nogil, range(N)))
+        else:
+            _logger.info("threaded_cpu_nogil skipped: numba not installed")
+    ppool = _get_pool()
+    list(ppool.map(_noop_worker, range(usable_cpu_count())))  # warm workers so spawn cost isn't measured
+    with timer("process_cpu"):
+        list(ppool.map(_cpu_worker, range(N), chunksize=chunksize))
+
+if __name__ == "__main__":
+    main()
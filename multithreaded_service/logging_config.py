@@ -1,27 +1,61 @@
 # Lightweight structured logging using stdlig; JSON like without extra deps
 import logging
 import os
+import sys
 from typing import Optional
 
 # Purpose: provide a tiny formatter that outputs logs as key=value pairs.
 # How: subclasses logging.Formatter and prefixes the formatted message with ts, lvl, logger, and msg.
 # Use: human-readable structured logs that are easy to parse with simple tools.
 class KeyValueFormatter(logging.Formatter):
+    _DATEFMT = "%Y-%m-%dT%H:%M:%S"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (epoch second, formatted ts); one tuple so concurrent readers never see a torn pair
+        self._ts_cache = (-1, "")
+
     # Purpose: format a LogRecord into a single-line, key=value string.
-    # How: call base Formatter.format to get the message, then add standardized fields.
+    # How: call base Formatter.format to get the message, then add standardized fields; the second-resolution timestamp is formatted once per second and reused.
     # Use: keeps timestamp, level, logger name, and message visible in consistent order.
     def format(self, record: logging.LogRecord) -> str:
         base = super().format(record)
-        return f"ts={self.formatTime(record, '%Y-%m-%dT%H:%M:%S')} lvl={record.levelname} logger={record.name} msg={base}"
+        sec = int(record.created)
+        cached_sec, ts = self._ts_cache
+        if sec != cached_sec:
+            ts = self.formatTime(record, self._DATEFMT)
+            self._ts_cache = (sec, ts)
+        return f"ts={ts} lvl={record.levelname} logger={record.name} msg={base}"
     
+# Purpose: StreamHandler that always writes to the current sys.stdout.
+# How: `stream` is a property resolved per emit, so later redirection (pytest capture, contextlib.redirect_stdout) is honored; flush only on a tty, so pipes/files keep TextIOWrapper's block buffering.
+# Use: selected by get_logger(..., to_stdout=True) for user-facing output such as timings.
+class _StdoutHandler(logging.StreamHandler):
+    def __init__(self):
+        super().__init__(sys.stdout)
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, _value):
+        pass
+
+    def flush(self):
+        stream = sys.stdout
+        if stream is not None and stream.isatty():
+            with self.lock:
+                stream.flush()
+
 # Purpose: return a configured logger instance with KeyValueFormatter attached.
-# How: creates a StreamHandler with KeyValueFormatter if the logger has no handlers, sets level from arg or LOG_LEVEL env var, and disables propagation to avoid duplicate logs.
+# How: creates a StreamHandler (stderr, or current sys.stdout with to_stdout=True) with KeyValueFormatter if the logger has no handlers, sets level from arg or LOG_LEVEL env var, and disables propagation to avoid duplicate logs.
 # Use: call get_logger(name) to get a ready-to-use, non-duplicating logger for modules.
-def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
+def get_logger(name: str, level: Optional[str] = None, to_stdout: bool = False) -> logging.Logger:
     try:
         logger = logging.getLogger(name)
         if not logger.handlers:
-            handler = logging.StreamHandler()
+            handler: logging.Handler = _StdoutHandler() if to_stdout else logging.StreamHandler()
             handler.setFormatter(KeyValueFormatter("%(message)s"))
             logger.addHandler(handler)
         env_level = (level or os.getenv("LOG_LEVEL", "INFO")).upper()
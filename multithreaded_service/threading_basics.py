@@ -1,31 +1,42 @@
-# Core threading examples: direct Thread, Lock, Queue, and ThreadPoolExecutor
-# CHANGED: add Optional to typing imports so queue can use Optional[int] for None sentinel
-from typing import List, Tuple, Optional
+# Core threading examples: direct Thread, Lock, deque handoff, and ThreadPoolExecutor
+from array import array
+from typing import Deque, List, Optional
+import asyncio
+import atexit
 import threading
 import time
-import queue
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count, repeat
 from .logging_config import get_logger
 
 _logger = get_logger("threading")
 
+# Shared pool for parallel_sleep so repeat calls reuse threads instead of creating new ones.
+# Fixed cap, created once and never shut down early, so concurrent callers can't race a rebuild.
+_SLEEP_POOL_SIZE = 32
+_SLEEP_POOL: Optional[ThreadPoolExecutor] = None
+_SLEEP_POOL_LOCK = threading.Lock()
+
 # Purpose: Increment a shared counter without synchronization so races occur.
 # How: start `n` threads that repeatedly increment a shared variable without a lock.
 # Use: run to observe lost updates caused by the GIL and scheduling races.
 # example of unsafe shared state mutation without locks
 # teaches what a race condition is and why shared memory is dangerous.
-def unsafe_increment(n: int, loops: int = 100_000) -> int:
+def unsafe_increment(n: int, loops: int = 100_000, expose_race: bool = False) -> int:
     """Increment shared counter without a lock. Expect race conditions.
-    This version intentionally magnifies the race by separating read/modify/write
-    and yielding the CPU between them.
+    With expose_race=True the race is magnified by yielding the CPU between
+    read and write (one syscall per iteration); the default skips the yield
+    so timings stay comparable with safe_increment.
     """
     counter = 0
     def _inc():
         nonlocal counter
         for _ in range(loops):
             tmp = counter          # read
-            os.sched_yield()       # force a context switch to expose the race
+            if expose_race:
+                os.sched_yield()   # force a context switch to expose the race
             counter = tmp + 1      # write (not atomic)
     threads = [threading.Thread(target=_inc) for _ in range(n)]
     for t in threads: t.start()
@@ -33,47 +44,73 @@ def unsafe_increment(n: int, loops: int = 100_000) -> int:
     return counter
 
 # Purpose: Increment a shared counter safely using a Lock so results are deterministic.
-# How: each increment happens while holding a threading.Lock to serialize access.
+# How: each thread counts into a private local, then folds it into the shared counter once under a threading.Lock.
 # Use: compare output with `unsafe_increment` to see correctness vs performance tradeoffs.
 # safe increment using threading.Lock to prevent race conditions
 def safe_increment(n: int, loops: int = 100_000) -> int:
-    """Increment shared counter with a lock. Thread-safe, deterministic."""
+    """Increment shared counter with a lock. Thread-safe, deterministic.
+    Privatized: lock traffic is one acquire per thread, not one per increment.
+    """
     counter = 0
     lock = threading.Lock()
     def _inc():
         nonlocal counter
+        local = 0
         for _ in range(loops):
-            with lock:
-                counter += 1
+            local += 1
+        with lock:
+            counter += local
     threads = [threading.Thread(target=_inc) for _ in range(n)]
     for t in threads: t.start()
     for t in threads: t.join()
     return counter
 
-# Purpose: Demonstrate a producer putting items into a Queue and a consumer processing them.
-# How: producer enqueues items and a sentinel; consumer dequeues until sentinel then processes items.
-# Use: study thread-safe handoff patterns and queue coordination.
-# classic producer-consumer with a thread-safe queue
-def producer_consumer(num_items: int = 5) -> List[int]:
-    """Classic producer-consumer with Queue. Thread-safe handoff."""
-    # allow None sentinel by typing the queue as Optional[int]
-    q: queue.Queue[Optional[int]] = queue.Queue()
+# Purpose: Increment a shared counter with no Python-level lock at all.
+# How: threads share one itertools.count; its C-level __next__ runs atomically under the GIL.
+# Use: compare with `safe_increment`; relies on the GIL, so not safe on free-threaded builds.
+# lock-free shared counter using a C-implemented iterator
+def atomic_increment(n: int, loops: int = 100_000) -> int:
+    """Increment a shared itertools.count from n threads. No Lock objects."""
+    counter = count()
+    def _inc():
+        for _ in range(loops):
+            next(counter)
+    threads = [threading.Thread(target=_inc) for _ in range(n)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+    return next(counter)  # count starts at 0, so the next value is the total
+
+# Purpose: Demonstrate a producer putting items into a deque and a consumer processing them.
+# How: classic two-semaphore bounded buffer; producer takes a free slot before each append and releases an item after it, consumer blocks on items, pops, and frees the slot.
+# Use: study thread-safe handoff, backpressure, and queue coordination.
+# producer-consumer with a deque (append/popleft are atomic in CPython) and two Semaphores
+def producer_consumer(num_items: int = 5, capacity: int = 2) -> List[int]:
+    """Producer-consumer with deque + Semaphores. Bounded to `capacity` in-flight items
+    (default 2 * one consumer) so a fast producer can't grow the buffer unbounded.
+    """
+    if capacity < 1:
+        raise ValueError("capacity must be >= 1")
+    q: Deque[int] = deque()
+    slots = threading.Semaphore(capacity)  # free buffer space
+    items = threading.Semaphore(0)         # items ready to consume
     results: List[int] = []
 
     def producer():
         for i in range(num_items):
-            _logger.info(f"producing {i}")
-            q.put(i)
-        q.put(None)  # Sentinel to signal consumer to stop (use None consistently)
+            _logger.info("producing %s", i)
+            slots.acquire()  # Backpressure: block while the buffer is full
+            q.append(i)
+            items.release()
+        items.release()  # Extra wake-up with nothing appended signals the end
 
     def consumer():
         while True:
-            item = q.get()
-            if item is None:
-                q.task_done()
-                break
+            items.acquire()  # Block (no polling) until an item or the end signal arrives
+            if not q:
+                break  # Every item release follows an append, so empty means done
+            item = q.popleft()
+            slots.release()
             results.append(item * 2)  # Process item
-            q.task_done()
 
     t1 = threading.Thread(target=producer)
     t2 = threading.Thread(target=consumer)
@@ -81,23 +118,66 @@ def producer_consumer(num_items: int = 5) -> List[int]:
     t1.join(); t2.join()
     return results
 
+# Purpose: one unit of simulated IO for parallel_sleep.
+# How: sleeps for `duration` and writes the time since `submitted` (monotonic_ns, integer math) into slot i of a shared array.
+# Use: module-level so it isn't rebuilt as a closure on every parallel_sleep call.
+def _sleep_task(i: int, duration: float, out: "array[int]", submitted: int) -> None:
+    time.sleep(duration)
+    # measured from submission, so time spent queued behind a busy pool shows up
+    out[i] = time.monotonic_ns() - submitted  # each task owns one slot; no lock needed
+
+# Purpose: return the lazily-created, process-wide thread pool for parallel_sleep.
+# How: builds a ThreadPoolExecutor capped at _SLEEP_POOL_SIZE on first use (threads start on demand) and registers shutdown at exit once.
+# Use: call _get_sleep_pool() instead of `with ThreadPoolExecutor(...)` for fan-outs up to _SLEEP_POOL_SIZE.
+def _get_sleep_pool() -> ThreadPoolExecutor:
+    global _SLEEP_POOL
+    with _SLEEP_POOL_LOCK:
+        if _SLEEP_POOL is None:
+            _SLEEP_POOL = ThreadPoolExecutor(max_workers=_SLEEP_POOL_SIZE, thread_name_prefix="sleep")
+            atexit.register(_SLEEP_POOL.shutdown)
+        return _SLEEP_POOL
+
+# Purpose: run the sleep tasks on `pool` and wait for all of them.
+# How: stamps the submission time once, map fills `elapsed` in place; draining the iterator surfaces any task exception here.
+# Use: shared by the pooled and one-off paths of parallel_sleep.
+def _drain(pool: ThreadPoolExecutor, n: int, duration: float, elapsed: "array[int]") -> None:
+    submitted = time.monotonic_ns()
+    for _ in pool.map(_sleep_task, range(n), repeat(duration, n), repeat(elapsed, n), repeat(submitted, n)):
+        pass
+
 # Purpose: run `n` sleep tasks concurrently and measure per-task elapsed time.
-# How: ThreadPoolExecutor schedules tasks; as_completed yields finished futures as they complete.
+# How: the shared ThreadPoolExecutor (or a one-off pool when n exceeds its cap) maps tasks; each writes its duration in ns into a preallocated array('q') (index = task id).
 # Use: verify concurrency reduces wall-clock time for IO-bound work vs sequential runs.
 # thread pool example for scalable IO fan-out
-def parallel_sleep(n: int = 4, duration: float = 0.1) -> List[Tuple[int, float]]:
-    """Run n tasks concurrently with ThreadPoolExecutor."""
-    def _task(i: int) -> Tuple[int, float]:
-        start = time.perf_counter()
-        time.sleep(duration)
-        return i, time.perf_counter() - start
-
-    results: List[Tuple[int, float]] = []
-    with ThreadPoolExecutor(max_workers=n) as pool:
-        futures = [pool.submit(_task, i) for i in range(n)]
-        for f in as_completed(futures):
-            try:
-                results.append(f.result())
-            except Exception as e:
-                _logger.error(f"parallel_sleep_error {e}")
-    return results
\ No newline at end of file
+def parallel_sleep(n: int = 4, duration: float = 0.1) -> "array[int]":
+    """Run n tasks concurrently with ThreadPoolExecutor; returns nanoseconds from submission to finish per task.
+
+    Calls with n <= 32 share one process-wide pool of 32 threads, so concurrent
+    callers can queue behind each other; that wait is included in the timings.
+    """
+    elapsed = array("q", bytes(8 * n))
+    if n <= _SLEEP_POOL_SIZE:
+        _drain(_get_sleep_pool(), n, duration, elapsed)
+    else:
+        # Larger fan-outs get a one-off pool so the shared one stays small
+        with ThreadPoolExecutor(max_workers=n) as pool:
+            _drain(pool, n, duration, elapsed)
+    return elapsed
+
+# Purpose: same n-sleeps fan-out as parallel_sleep, on one thread with asyncio.
+# How: asyncio.gather runs n asyncio.sleep coroutines; no thread creation or per-thread stack.
+# Use: compare with parallel_sleep; call from sync code only (asyncio.run needs no running loop).
+def parallel_sleep_async(n: int = 4, duration: float = 0.1) -> "array[int]":
+    """Run n sleeps concurrently as coroutines; returns elapsed nanoseconds per task."""
+    elapsed = array("q", bytes(8 * n))
+
+    async def _one(i: int) -> None:
+        start = time.monotonic_ns()
+        await asyncio.sleep(duration)
+        elapsed[i] = time.monotonic_ns() - start
+
+    async def _all() -> None:
+        await asyncio.gather(*[_one(i) for i in range(n)])
+
+    asyncio.run(_all())
+    return elapsed
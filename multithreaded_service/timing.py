@@ -1,24 +1,116 @@
-# Timing context manager; prints label + duration; resilient to exceptions
-from contextlib import contextmanager
+# Timing context managers; print label + duration; resilient to exceptions
+from array import array
+import functools
+import sys
 import time
-from typing import Iterator, Optional
+from typing import Callable, List, Optional, Sequence, TypeVar, Union
+from .config import env_bool
 from .logging_config import get_logger
 
-_logger = get_logger("timing")
+# Timing lines are plain buffered writes to the current stdout; only error records go
+# through this logger (also stdout, INFO-pinned so LOG_LEVEL doesn't hide them).
+# Use MT_TIMING to turn timing off.
+_logger = get_logger("timing", level="INFO", to_stdout=True)
+
+T = TypeVar("T")
+
+# Set MT_TIMING=0 to make `timer` a no-op (read once at import).
+TIMING_ENABLED = env_bool("MT_TIMING", default=True)
+
+# Pre-resolved callables for the hot path; skips a module/attribute lookup per call.
+_perf_ns = time.perf_counter_ns
+_log_error = _logger.error
 
 # Purpose: measure how long a code block takes, for quick timings and postmortems.
-# How: contextmanager captures start time with time.perf_counter(), yields control, then logs on exceptions and prints duration on success.
-# Use: wrap a block with `with timer("name"):` to print elapsed time or log errors with duration.
-@contextmanager
-def timer(label: Optional[str] = None) -> Iterator[None]:
-    start = time.perf_counter()
-    try:
-        yield
-    except Exception as e:
-        # Ensure timing still logs even on failure for postmortems
-        dur = time.perf_counter() - start
-        _logger.error(f"label={label or 'n/a'} error={type(e).__name__} duration_s={dur:.4f}")
-        raise
-    else:
-        dur = time.perf_counter() - start
-        print(f"{label or 'block'} {dur:.4f}s")
+# How: plain class context manager (no generator frame); __enter__ stamps time.perf_counter_ns(), __exit__ logs errors on exceptions and writes one buffered stdout line on success.
+# Use: wrap a block with `with timer("name"):` (or decorate a function with `@timer("name")`) to print elapsed time or log errors with duration.
+class _active_timer:
+    __slots__ = ("label", "start")
+
+    def __init__(self, label: Optional[str] = None):
+        self.label = label if label is not None else "block"
+        self.start = 0
+
+    def __enter__(self) -> None:
+        self.start = _perf_ns()
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        dur_ns = _perf_ns() - self.start
+        if exc_type is not None:
+            # Ensure timing still logs even on failure for postmortems
+            if issubclass(exc_type, Exception):
+                _log_error("label=%s error=%s duration_s=%.4f", self.label, exc_type.__name__, dur_ns * 1e-9)
+        else:
+            # One write to the current stdout, no flush: pipes/files stay block-buffered by
+            # TextIOWrapper and no LogRecord is built on the hot path
+            sys.stdout.write(self.label + " " + format(dur_ns / 1e9, ".4f") + "s\n")
+        return False  # never swallow the exception
+
+    # Purpose: support `@timer("name")` on functions, as the old @contextmanager version did.
+    # How: each call of the wrapped function enters a fresh timer, so recursion and threads never share `start`.
+    def __call__(self, fn: Callable[..., T]) -> Callable[..., T]:
+        label = self.label
+
+        @functools.wraps(fn)
+        def _wrapped(*args, **kwargs):
+            with _active_timer(label):
+                return fn(*args, **kwargs)
+        return _wrapped
+
+# Purpose: stand-in for `timer` when timing is disabled.
+# How: empty __enter__/__exit__; no clock reads, logging, or stdout writes.
+# Use: selected as `timer` at import when MT_TIMING is off; same signature so call sites don't change.
+class _noop_timer:
+    __slots__ = ()
+
+    def __init__(self, label: Optional[str] = None):
+        pass
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    # Decorator form returns the function untouched; no wrapper overhead when timing is off.
+    def __call__(self, fn: Callable[..., T]) -> Callable[..., T]:
+        return fn
+
+# Purpose: pick the timer implementation for a given on/off setting.
+# How: returns the class itself; no module state is touched, so tests can call it directly.
+# Use: `timer` below is bound once from TIMING_ENABLED at import.
+def _select_timer(enabled: bool) -> type:
+    return _active_timer if enabled else _noop_timer
+
+timer = _select_timer(TIMING_ENABLED)
+
+# Purpose: time many short phases with O(1) setup instead of one context manager per phase.
+# How: preallocated int64 arrays hold start stamps and durations (perf_counter_ns); report() formats everything in one pass and writes one stdout line, like timer.
+# Use: pt = PhaseTimer(["load", "parse"]) or PhaseTimer(3); call pt.start(i) / pt.stop(i) around each phase, then pt.report().
+class PhaseTimer:
+    __slots__ = ("_labels", "_starts", "_durs")
+
+    def __init__(self, labels: Union[int, Sequence[str]]):
+        if isinstance(labels, int):
+            labels = [f"phase{i}" for i in range(labels)]
+        self._labels = list(labels)
+        n = len(self._labels)
+        self._starts = array("q", bytes(8 * n))
+        self._durs = array("q", bytes(8 * n))
+
+    def start(self, i: int) -> None:
+        self._starts[i] = _perf_ns()
+
+    def stop(self, i: int) -> None:
+        self._durs[i] = _perf_ns() - self._starts[i]
+
+    # Purpose: per-phase durations in seconds, in label order.
+    def durations(self) -> List[float]:
+        return [d / 1e9 for d in self._durs]
+
+    # Purpose: print all phases on one line, "label=N.NNNNs ...", to the current stdout like timer.
+    # No-op when MT_TIMING is off, so nothing is formatted in that case.
+    def report(self) -> None:
+        if not TIMING_ENABLED:
+            return
+        sys.stdout.write(" ".join(f"{lbl}={d / 1e9:.4f}s" for lbl, d in zip(self._labels, self._durs)) + "\n")
@@ -0,0 +1,26 @@
+import os
+from multithreaded_service.config import env_bool, env_float, env_int, usable_cpu_count
+
+# Purpose: verify env helpers parse set values and fall back on unset or bad input.
+# How: set env vars with monkeypatch and check each helper's return value.
+# Use: protects config parsing used to gate features and size pools.
+def test_env_helpers(monkeypatch):
+    monkeypatch.setenv("MT_FLAG", "Yes")
+    monkeypatch.setenv("MT_FLOAT", "1.5")
+    monkeypatch.setenv("MT_INT", "oops")
+    monkeypatch.delenv("MT_UNSET", raising=False)
+    assert env_bool("MT_FLAG") is True
+    assert env_bool("MT_UNSET", default=True) is True
+    assert env_float("MT_FLOAT", 0.0) == 1.5
+    assert env_int("MT_INT", 7) == 7
+    assert env_int("MT_UNSET", 3) == 3
+    for raw, want in ((" 42 ", 42), ("-3", -3), ("+8", 8), ("--5", 1), ("-", 1), ("", 1)):
+        monkeypatch.setenv("MT_INT", raw)
+        assert env_int("MT_INT", 1) == want
+
+# Purpose: sanity-check the usable CPU count used to size pools.
+# How: must be positive and never exceed the machine's reported CPU count.
+# Use: guards pool sizing on cgroup-limited CI runners.
+def test_usable_cpu_count_bounds():
+    n = usable_cpu_count()
+    assert 1 <= n <= (os.cpu_count() or n)
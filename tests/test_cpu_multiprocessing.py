@@ -0,0 +1,34 @@
+import sys
+import threading
+from multithreaded_service.config import usable_cpu_count
+from multithreaded_service.cpu_multiprocessing import _mp_context, run_process_pool
+
+# Known Fibonacci values; keeps the test driver from recomputing what the pool computes
+_FIB = {20: 6765, 21: 10946, 22: 17711}
+
+# Purpose: verify the process pool returns correct fib values in input order.
+# How: run a few small CPU-bound tasks across worker processes and compare to a checked-in table.
+# Use: keeps CI fast (small n) while exercising pickling and result ordering.
+def test_process_pool_correctness():
+    # Deliberately unsorted: results must follow input order, no re-sorting needed
+    work = [22, 20, 21]
+    max_workers = min(4, usable_cpu_count())
+    expected = [(n, _FIB[n]) for n in work]
+    assert run_process_pool(work, max_workers) == expected
+
+# Purpose: ensure the shared pool never forks while other threads are alive.
+# How: hold a helper thread open on an Event and ask _mp_context which start method it would use.
+# Use: guards against fork-with-threads deadlocks on Linux; other platforms use their default.
+def test_mp_context_avoids_fork_with_live_threads():
+    release = threading.Event()
+    t = threading.Thread(target=release.wait)
+    t.start()
+    try:
+        ctx = _mp_context()
+    finally:
+        release.set()
+        t.join()
+    if sys.platform.startswith("linux"):
+        assert ctx.get_start_method() == "forkserver"
+    else:
+        assert ctx is None
@@ -0,0 +1,43 @@
+import pytest
+from multithreaded_service import cpu_tasks as ct
+
+# Purpose: confirm the fast fib matches the naive and memoized variants.
+# How: compare all implementations over a small range where naive recursion is cheap.
+# Use: guards against regressions when swapping fib algorithms.
+def test_fib_variants_agree():
+    for n in range(20):
+        assert ct.fib(n) == ct.fib_naive(n) == ct.fib_recursive_memo(n)
+
+# Purpose: verify fib rejects negative input.
+# How: call fib with -1 and expect ValueError.
+# Use: keeps input validation consistent across CPU helpers.
+def test_fib_negative_raises():
+    with pytest.raises(ValueError):
+        ct.fib(-1)
+
+# Purpose: check fast doubling agrees with the iterative loop across the dispatch cutoff.
+# How: compare fib_fast_doubling against a plain loop for n on both sides of the threshold.
+# Use: ensures fib returns identical values regardless of which path it takes.
+def test_fib_fast_doubling_matches_loop():
+    a, b = 0, 1
+    for n in range(200):
+        assert ct.fib_fast_doubling(n) == a
+        assert ct.fib(n) == a
+        a, b = b, a + b
+
+# Purpose: confirm the JIT variants match their pure Python counterparts.
+# How: compare outputs for small n; runs as plain Python when numba is absent.
+# Use: keeps the nogil fast path interchangeable with fib/sum_range.
+def test_njit_variants_match():
+    for n in range(40):
+        assert ct.fib_njit(n) == ct.fib(n)
+        assert ct.sum_range_njit(n) == ct.sum_range(n)
+    for n in range(15):
+        assert ct.fib_naive_njit(n) == ct.fib_naive(n)
+
+# Purpose: verify the closed-form sum_range matches a direct sum.
+# How: compare against sum(range(n)) for small n, including 0 and 1.
+# Use: guards the Gauss formula edge cases.
+def test_sum_range_closed_form():
+    for n in range(50):
+        assert ct.sum_range(n) == sum(range(n))
@@ -0,0 +1,58 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multithreaded_service import io_tasks as io
+
+# Minimal handler: 200 with empty body, no access log noise.
+class _OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+# Purpose: confirm sessions are cached per (timeout, retries) for connection reuse.
+# How: request the same key twice and a different key once; compare identities.
+# Use: guards keep-alive pooling in fetch_url against accidental per-call sessions.
+def test_get_session_is_cached():
+    assert io._get_session(1.0, 0) is io._get_session(1.0, 0)
+    assert io._get_session(1.0, 0) is not io._get_session(2.0, 0)
+
+# Purpose: confirm the session cache stays bounded and evicts least recently used entries.
+# How: request more distinct keys than the cache holds; the first key must come back as a fresh session.
+# Use: guards against unbounded session (and socket) growth.
+def test_get_session_evicts_oldest():
+    first = io._get_session(10.0, 0)
+    for i in range(io._MAX_SESSIONS):
+        io._get_session(11.0 + i, 0)
+    assert len(io._SESSIONS) <= io._MAX_SESSIONS
+    assert io._get_session(10.0, 0) is not first
+
+# Purpose: check async fan-out matches the serial baseline against a local server.
+# How: serve 200s from a throwaway http.server thread; include an unreachable URL for the error path.
+# Use: exercises fetch_all_async without external network access.
+def test_fetch_all_async_matches_serial():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t.start()
+    try:
+        base = f"http://127.0.0.1:{server.server_port}"
+        urls = [f"{base}/a", f"{base}/b", "http://127.0.0.1:1/closed"]
+        got = io.fetch_all_async(urls, timeout=2.0)
+        assert [(u, code) for u, code, _ in got] == [(urls[0], 200), (urls[1], 200), (urls[2], 0)]
+        assert got[2][2]
+        assert [code for _, code, _ in io.fetch_all_serial(urls[:2], timeout=2.0)] == [200, 200]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+# Purpose: ensure closing a throwaway session can't tear down the cached session's pool.
+# How: compare the adapters mounted on a fresh _session and the cached one.
+# Use: guards keep-alive reuse against `with _session() as s:` callers.
+def test_sessions_do_not_share_adapters():
+    cached = io._get_session()
+    with io._session() as s:
+        assert s.get_adapter("http://x") is not cached.get_adapter("http://x")
@@ -1,5 +1,12 @@
 # Minimal health checks; fast, deterministic, CI-friendly
-from multithreaded_service.timing import timer
+import contextlib
+import io
+import logging
+import os
+import subprocess
+import sys
+from multithreaded_service import timing
+from multithreaded_service.timing import timer, PhaseTimer
 from multithreaded_service.io_tasks import pretend_io, iter_pretend_io
 
 # Purpose: sanity-check basic math works in test runner.
@@ -9,12 +16,14 @@ def test_smoke_math():
     assert 1 + 1 == 2
     
 # Purpose: verify the timing context manager prints a labeled duration.
-# How: use `timer("unit-test")` in a with-block, capture stdout via capsys.
+# How: use `timer("unit-test")` in a with-block with stdout redirected to a StringIO buffer.
 # Use: ensures timer prints label and time format expected by other tests.
-def test_timer_cm_prints_duration(capsys):
-    with timer("unit-test"):
-        pass
-    out = capsys.readouterr().out
+def test_timer_cm_prints_duration():
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        with timer("unit-test"):
+            pass
+    out = buf.getvalue()
     assert "unit-test" in out
     assert "s" in out
     
@@ -25,4 +34,97 @@ def test_iter_pretend_io_yields_three_items():
     gen = iter_pretend_io(count=3, duration=0.01)
     results = list(gen)
     assert len(results) == 3
-    assert all(r >= 0 for r in results)
\ No newline at end of file
+    assert all(r >= 0 for r in results)
+
+# Purpose: confirm PhaseTimer records one duration per phase and reports each label.
+# How: time each iter_pretend_io yield into its own slot, then capture the single report line on stdout.
+# Use: ensures batched phase timing works for benchmark drivers timing many short blocks.
+def test_phase_timer_records_each_phase(capsys):
+    pt = PhaseTimer(3)
+    gen = iter_pretend_io(count=3, duration=0.01)
+    for i in range(3):
+        pt.start(i)
+        next(gen)
+        pt.stop(i)
+    assert all(d > 0 for d in pt.durations())
+    pt.report()
+    out = capsys.readouterr().out
+    assert out.count("\n") == 1
+    assert all(f"phase{i}=" in out for i in range(3))
+
+# Purpose: verify PhaseTimer.report honors MT_TIMING like timer does.
+# How: flip TIMING_ENABLED off for the test and check report writes nothing.
+# Use: keeps both timing APIs silent when instrumentation is disabled.
+def test_phase_timer_report_respects_timing_disabled(monkeypatch, capsys):
+    monkeypatch.setattr(timing, "TIMING_ENABLED", False)
+    pt = PhaseTimer(["load"])
+    pt.start(0)
+    pt.stop(0)
+    pt.report()
+    assert capsys.readouterr().out == ""
+
+# Purpose: verify disabling timing selects a silent no-op timer.
+# How: call _select_timer directly (no module reload), run a block with the no-op, and check stdout stays empty.
+# Use: guards the zero-overhead production path for instrumentation.
+def test_timer_disabled_is_silent():
+    assert timing._select_timer(True) is timing._active_timer
+    noop = timing._select_timer(False)
+    assert noop is timing._noop_timer
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        with noop("quiet"):
+            pass
+    assert buf.getvalue() == ""
+
+# Purpose: verify MT_TIMING=0 in the environment selects the no-op timer at import.
+# How: import timing in a fresh interpreter with MT_TIMING=0 so the real import-time path runs (no reload here).
+# Use: guards the env wiring that test_timer_disabled_is_silent bypasses.
+def test_mt_timing_env_selects_noop_at_import():
+    code = "from multithreaded_service import timing; assert timing.timer is timing._noop_timer"
+    env = {**os.environ, "MT_TIMING": "0"}
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, "-c", code], env=env, cwd=root, check=True)
+
+# Purpose: verify timer output is written when the block ends and follows stdout redirection.
+# How: run a timed block inside contextlib.redirect_stdout and read the buffer immediately.
+# Use: guards against buffering or binding a stale stdout in the timing logger.
+def test_timer_follows_redirected_stdout():
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        with timer("redirected"):
+            pass
+    assert "redirected" in buf.getvalue()
+
+# Purpose: verify timer output stays block-buffered when stdout is not a terminal.
+# How: redirect stdout to a StringIO that counts flush() calls (isatty() is False) and time several blocks.
+# Use: guards against one write syscall per timed block on pipes and files.
+def test_timer_does_not_flush_non_tty_stdout():
+    class _CountingIO(io.StringIO):
+        flushes = 0
+
+        def flush(self):
+            self.flushes += 1
+            super().flush()
+
+    buf = _CountingIO()
+    with contextlib.redirect_stdout(buf):
+        for _ in range(5):
+            with timer("buffered"):
+                pass
+    assert buf.getvalue().count("buffered") == 5
+    assert buf.flushes == 0
+
+# Purpose: verify timer still works as a function decorator, including recursion.
+# How: decorate a recursive function and count one printed line per call.
+# Use: guards the ContextDecorator behaviour the original @contextmanager timer had.
+def test_timer_as_decorator():
+    @timer("deco")
+    def countdown(n):
+        return 0 if n == 0 else 1 + countdown(n - 1)
+
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        assert countdown(2) == 2
+    assert buf.getvalue().count("deco ") == 3
+    assert countdown.__name__ == "countdown"
+    assert timing._noop_timer("off")(len) is len
@@ -2,15 +2,17 @@ import pytest
 from multithreaded_service import threading_basics as tb
 
 # Purpose: demonstrate difference between unsafe and locked increments.
-# How: runs an unsafe increment (no lock) and a safe increment (with lock) many times.
+# How: runs an unsafe increment (no lock, race exposed) and a safe increment (with lock) many times.
 # Use: asserts the unsafe result is lower due to race, and safe equals threads*loops.
 def test_race_condition():
-    wrong = tb.unsafe_increment(4, loops=10_000)
+    wrong = tb.unsafe_increment(4, loops=10_000, expose_race=True)
     right = tb.safe_increment(4, loops=10_000)
     # Unsafe version should be less than expected
     assert wrong < right
     # Safe version should equal threads * loops
     assert right == 4 * 10_000
+    # Lock-free shared counter is exact too
+    assert tb.atomic_increment(4, loops=10_000) == 4 * 10_000
     
 # Purpose: validate a simple producer/consumer pipeline produces expected outputs.
 # How: calls producer_consumer to run producer/consumer threads and collects results.
@@ -18,13 +20,32 @@ def test_race_condition():
 def test_producer_consumer():
     results = tb.producer_consumer(5)
     assert sorted(results) == [i * 2 for i in range(5)]
+    # A one-slot buffer forces backpressure on every item but loses nothing
+    assert tb.producer_consumer(50, capacity=1) == [i * 2 for i in range(50)]
 
 # Purpose: check parallel sleep tasks run concurrently, not sequentially.
 # How: start multiple sleeps in parallel and assert each task's elapsed time ~duration.
 # Use: sanity-check that threading reduces wall-clock time for IO-bound sleeps.
 def test_parallel_sleep_timing():
-    results = tb.parallel_sleep(n=4, duration=0.2)
-    assert len(results) == 4
-    for _, elapsed in results:
-        # Even with 0.2s sleep, elapsed per task should be ~0.2s not 0.8s
-        assert elapsed < 0.5
\ No newline at end of file
+    elapsed = tb.parallel_sleep(n=4, duration=0.2)
+    assert len(elapsed) == 4
+    for e in elapsed:
+        # Even with 0.2s sleep, elapsed per task should be ~0.2s not 0.8s (values are ns)
+        assert 0 < e < 0.5e9
+
+# Purpose: check parallel_sleep reuses one process-wide pool instead of building one per call.
+# How: call _get_sleep_pool twice around a parallel_sleep run and compare identities.
+# Use: guards against reintroducing per-call thread pool setup/teardown.
+def test_sleep_pool_is_reused():
+    pool = tb._get_sleep_pool()
+    tb.parallel_sleep(n=2, duration=0.01)
+    assert tb._get_sleep_pool() is pool
+
+# Purpose: check the asyncio variant overlaps sleeps just like the thread pool.
+# How: run 4 coroutine sleeps and assert every slot was filled with ~duration.
+# Use: confirms single-threaded asyncio fan-out matches threaded IO concurrency.
+def test_parallel_sleep_async_timing():
+    elapsed = tb.parallel_sleep_async(n=4, duration=0.2)
+    assert len(elapsed) == 4
+    for e in elapsed:
+        assert 0 < e < 0.5e9